@@ -25,55 +25,55 @@ activities = {
         "description": "Learn tennis techniques and participate in friendly matches",
         "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
         "max_participants": 16,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
         },
     "Basketball Team": {
         "description": "Competitive basketball training and games",
         "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
         "max_participants": 15,
-        "participants": ["james@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"james@mergington.edu", "lucas@mergington.edu"}
         },
     "Drama Club": {
         "description": "Theater productions, acting, and stage performance",
         "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
         "max_participants": 25,
-        "participants": ["isabella@mergington.edu"]
+        "participants": {"isabella@mergington.edu"}
         },
     "Art Studio": {
         "description": "Painting, drawing, and visual arts exploration",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["grace@mergington.edu", "noah@mergington.edu"]
+        "participants": {"grace@mergington.edu", "noah@mergington.edu"}
         },
     "Debate Team": {
         "description": "Competitive debate and public speaking skills",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["aiden@mergington.edu"]
+        "participants": {"aiden@mergington.edu"}
         },
     "Science Club": {
         "description": "Hands-on experiments and STEM exploration",
         "schedule": "Thursdays, 3:30 PM - 4:45 PM",
         "max_participants": 20,
-        "participants": ["mia@mergington.edu", "ethan@mergington.edu"]
+        "participants": {"mia@mergington.edu", "ethan@mergington.edu"}
         },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
@@ -104,7 +104,7 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student already signed up for this activity")
     
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
@@ -123,5 +123,5 @@ def unregister_from_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Student is not signed up for this activity")
     
     # Remove student
-    activity["participants"].remove(email)
+    activity["participants"].discard(email)
     return {"message": f"Unregistered {email} from {activity_name}"}
@@ -2,101 +2,132 @@
 Tests for the Mergington High School API
 """
 
+import asyncio
+import json
+
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
-from pathlib import Path
-import sys
+from urllib.parse import quote
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from app import app, get_activities
 
-from app import app
+# Baseline activity data, built once; each test works on a deep copy
+_ORIGINAL_ACTIVITIES = {
+    "Tennis Club": {
+        "description": "Learn tennis techniques and participate in friendly matches",
+        "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
+        "max_participants": 16,
+        "participants": {"alex@mergington.edu"}
+    },
+    "Basketball Team": {
+        "description": "Competitive basketball training and games",
+        "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
+        "max_participants": 15,
+        "participants": {"james@mergington.edu", "lucas@mergington.edu"}
+    },
+    "Drama Club": {
+        "description": "Theater productions, acting, and stage performance",
+        "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
+        "max_participants": 25,
+        "participants": {"isabella@mergington.edu"}
+    },
+    "Art Studio": {
+        "description": "Painting, drawing, and visual arts exploration",
+        "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
+        "max_participants": 18,
+        "participants": {"grace@mergington.edu", "noah@mergington.edu"}
+    },
+    "Debate Team": {
+        "description": "Competitive debate and public speaking skills",
+        "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
+        "max_participants": 14,
+        "participants": {"aiden@mergington.edu"}
+    },
+    "Science Club": {
+        "description": "Hands-on experiments and STEM exploration",
+        "schedule": "Thursdays, 3:30 PM - 4:45 PM",
+        "max_participants": 20,
+        "participants": {"mia@mergington.edu", "ethan@mergington.edu"}
+    },
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    }
+}
 
 
-@pytest.fixture
+# URL-encoded base path per activity, computed once for all tests
+_PATHS = {name: f"/activities/{quote(name)}" for name in _ORIGINAL_ACTIVITIES}
+
+# Serialized once at import; json.loads runs in C and beats a pure-Python
+# deepcopy walk for this small JSON-shaped structure
+_ORIGINAL_JSON = json.dumps(_ORIGINAL_ACTIVITIES, default=list)
+
+
+def _fresh_activities():
+    """Rebuild the baseline from the pre-serialized JSON blob"""
+    fresh = json.loads(_ORIGINAL_JSON)
+    for activity in fresh.values():
+        activity["participants"] = set(activity["participants"])
+    return fresh
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client shared across the whole session"""
+    # No endpoint under test redirects, and skipping the exception
+    # re-raise wrapper shaves a little off every dispatch
+    with TestClient(
+        app, follow_redirects=False, raise_server_exceptions=False
+    ) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Async client that talks to the app directly over ASGI"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
 
 
 @pytest.fixture
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    from app import activities
-    
-    # Store original state
-    original = {
-        "Tennis Club": {
-            "description": "Learn tennis techniques and participate in friendly matches",
-            "schedule": "Wednesdays and Saturdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["alex@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Competitive basketball training and games",
-            "schedule": "Mondays and Thursdays, 3:30 PM - 5:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu", "lucas@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Theater productions, acting, and stage performance",
-            "schedule": "Tuesdays and Fridays, 4:00 PM - 5:30 PM",
-            "max_participants": 25,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Painting, drawing, and visual arts exploration",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 18,
-            "participants": ["grace@mergington.edu", "noah@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Competitive debate and public speaking skills",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 5:00 PM",
-            "max_participants": 14,
-            "participants": ["aiden@mergington.edu"]
-        },
-        "Science Club": {
-            "description": "Hands-on experiments and STEM exploration",
-            "schedule": "Thursdays, 3:30 PM - 4:45 PM",
-            "max_participants": 20,
-            "participants": ["mia@mergington.edu", "ethan@mergington.edu"]
-        },
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    }
-    
-    # Clear and reset
-    activities.clear()
-    activities.update(original)
-    
-    yield
-    
-    # Reset after test
-    activities.clear()
-    activities.update(original)
+def reset_activities(monkeypatch):
+    """Give each test a fresh activities dict, reverted automatically"""
+    # Handlers look up `activities` through module globals, so swapping
+    # the module attribute is enough; monkeypatch restores the original.
+    monkeypatch.setattr("app.activities", _fresh_activities())
+
+
+@pytest.fixture(scope="class")
+def seeded_activities():
+    """Seed the baseline once for a class of read-only tests"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.activities", _fresh_activities())
+        yield
 
 
+@pytest.mark.usefixtures("seeded_activities")
 class TestGetActivities:
     """Tests for GET /activities endpoint"""
-    
-    def test_get_activities_returns_all_activities(self, client, reset_activities):
+
+    def test_get_activities_returns_all_activities(self, client):
         """Test that GET /activities returns all activities"""
         response = client.get("/activities")
         assert response.status_code == 200
@@ -105,24 +136,25 @@ class TestGetActivities:
         assert "Tennis Club" in data
         assert "Basketball Team" in data
     
-    def test_activity_structure(self, client, reset_activities):
+    def test_activity_structure(self):
         """Test that activity objects have correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
+        # Shape-only check; call the handler directly and skip the HTTP layer
+        data = get_activities()
+
         activity = data["Tennis Club"]
         assert "description" in activity
         assert "schedule" in activity
         assert "max_participants" in activity
         assert "participants" in activity
-    
-    def test_participants_list(self, client, reset_activities):
+
+    def test_participants_list(self):
         """Test that participants list is correct"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        assert "alex@mergington.edu" in data["Tennis Club"]["participants"]
-        assert "james@mergington.edu" in data["Basketball Team"]["participants"]
+        data = get_activities()
+
+        assert data["Tennis Club"]["participants"] == {"alex@mergington.edu"}
+        assert data["Basketball Team"]["participants"] == {
+            "james@mergington.edu", "lucas@mergington.edu"
+        }
 
 
 class TestSignup:
@@ -131,7 +163,7 @@ class TestSignup:
     def test_successful_signup(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Tennis%20Club/signup?email=newstudent@mergington.edu"
+            _PATHS["Tennis Club"] + "/signup?email=newstudent@mergington.edu"
         )
         assert response.status_code == 200
         data = response.json()
@@ -140,45 +172,38 @@ class TestSignup:
     
     def test_signup_adds_participant(self, client, reset_activities):
         """Test that signup actually adds participant to the list"""
-        client.post("/activities/Tennis%20Club/signup?email=newstudent@mergington.edu")
+        client.post(_PATHS["Tennis Club"] + "/signup?email=newstudent@mergington.edu")
         
         response = client.get("/activities")
         participants = response.json()["Tennis Club"]["participants"]
-        assert "newstudent@mergington.edu" in participants
-    
-    def test_signup_nonexistent_activity(self, client, reset_activities):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Activity/signup?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert set(participants) == {"alex@mergington.edu", "newstudent@mergington.edu"}
     
     def test_duplicate_signup(self, client, reset_activities):
         """Test that duplicate signup is rejected"""
         # alex@mergington.edu is already in Tennis Club
         response = client.post(
-            "/activities/Tennis%20Club/signup?email=alex@mergington.edu"
+            _PATHS["Tennis Club"] + "/signup?email=alex@mergington.edu"
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
     
-    def test_signup_multiple_activities(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_multiple_activities(self, async_client, reset_activities):
         """Test that a student can sign up for multiple activities"""
-        # Sign up for first activity
-        response1 = client.post(
-            "/activities/Tennis%20Club/signup?email=multisport@mergington.edu"
+        # Sign up for both activities concurrently (independent targets)
+        response1, response2 = await asyncio.gather(
+            async_client.post(
+                _PATHS["Tennis Club"] + "/signup?email=multisport@mergington.edu"
+            ),
+            async_client.post(
+                _PATHS["Basketball Team"] + "/signup?email=multisport@mergington.edu"
+            ),
         )
         assert response1.status_code == 200
-        
-        # Sign up for second activity
-        response2 = client.post(
-            "/activities/Basketball%20Team/signup?email=multisport@mergington.edu"
-        )
         assert response2.status_code == 200
-        
+
         # Verify both signups
-        response = client.get("/activities")
+        response = await async_client.get("/activities")
         assert "multisport@mergington.edu" in response.json()["Tennis Club"]["participants"]
         assert "multisport@mergington.edu" in response.json()["Basketball Team"]["participants"]
 
@@ -189,7 +214,7 @@ class TestUnregister:
     def test_successful_unregister(self, client, reset_activities):
         """Test successful unregistration from an activity"""
         response = client.post(
-            "/activities/Tennis%20Club/unregister?email=alex@mergington.edu"
+            _PATHS["Tennis Club"] + "/unregister?email=alex@mergington.edu"
         )
         assert response.status_code == 200
         data = response.json()
@@ -198,79 +223,89 @@ class TestUnregister:
     
     def test_unregister_removes_participant(self, client, reset_activities):
         """Test that unregister actually removes participant"""
-        client.post("/activities/Tennis%20Club/unregister?email=alex@mergington.edu")
+        client.post(_PATHS["Tennis Club"] + "/unregister?email=alex@mergington.edu")
         
         response = client.get("/activities")
         participants = response.json()["Tennis Club"]["participants"]
-        assert "alex@mergington.edu" not in participants
-    
-    def test_unregister_nonexistent_activity(self, client, reset_activities):
-        """Test unregister from non-existent activity"""
-        response = client.post(
-            "/activities/Fake%20Activity/unregister?email=student@mergington.edu"
-        )
-        assert response.status_code == 404
-        assert "Activity not found" in response.json()["detail"]
+        assert set(participants) == set()
     
     def test_unregister_not_registered(self, client, reset_activities):
         """Test unregister of student not in the activity"""
         response = client.post(
-            "/activities/Tennis%20Club/unregister?email=notstudent@mergington.edu"
+            _PATHS["Tennis Club"] + "/unregister?email=notstudent@mergington.edu"
         )
         assert response.status_code == 400
         assert "not signed up" in response.json()["detail"]
     
-    def test_signup_then_unregister(self, client, reset_activities):
+    @pytest.mark.asyncio
+    async def test_signup_then_unregister(self, async_client, reset_activities):
         """Test signup followed by unregister"""
         email = "testuser@mergington.edu"
-        
+
         # Sign up
-        response1 = client.post(
-            "/activities/Tennis%20Club/signup?email=" + email
+        response1 = await async_client.post(
+            _PATHS["Tennis Club"] + "/signup?email=" + email
         )
         assert response1.status_code == 200
-        
+
         # Verify signup
-        response2 = client.get("/activities")
+        response2 = await async_client.get("/activities")
         assert email in response2.json()["Tennis Club"]["participants"]
-        
+
         # Unregister
-        response3 = client.post(
-            "/activities/Tennis%20Club/unregister?email=" + email
+        response3 = await async_client.post(
+            _PATHS["Tennis Club"] + "/unregister?email=" + email
         )
         assert response3.status_code == 200
-        
+
         # Verify unregister
-        response4 = client.get("/activities")
+        response4 = await async_client.get("/activities")
         assert email not in response4.json()["Tennis Club"]["participants"]
 
 
+class TestNonexistentActivity:
+    """Shared 404 behavior for signup and unregister"""
+
+    @pytest.mark.parametrize("action", ["signup", "unregister"])
+    def test_nonexistent_activity(self, client, reset_activities, action):
+        """Test that both endpoints 404 for an unknown activity"""
+        response = client.post(
+            f"/activities/Fake%20Activity/{action}?email=student@mergington.edu"
+        )
+        assert response.status_code == 404
+        assert "Activity not found" in response.json()["detail"]
+
+
 class TestIntegration:
     """Integration tests for complex scenarios"""
     
-    def test_full_workflow(self, client, reset_activities):
+    @pytest.mark.slow
+    @pytest.mark.asyncio
+    async def test_full_workflow(self, async_client, reset_activities):
         """Test complete workflow: get activities, signup, unregister"""
         # Get all activities
-        response1 = client.get("/activities")
+        response1 = await async_client.get("/activities")
         assert response1.status_code == 200
-        initial_tennis_count = len(response1.json()["Tennis Club"]["participants"])
-        
+        initial_participants = set(response1.json()["Tennis Club"]["participants"])
+
         # Sign up for activity
-        response2 = client.post(
-            "/activities/Tennis%20Club/signup?email=workflow@mergington.edu"
+        response2 = await async_client.post(
+            _PATHS["Tennis Club"] + "/signup?email=workflow@mergington.edu"
         )
         assert response2.status_code == 200
-        
+
         # Verify signup
-        response3 = client.get("/activities")
-        assert len(response3.json()["Tennis Club"]["participants"]) == initial_tennis_count + 1
-        
+        response3 = await async_client.get("/activities")
+        assert set(response3.json()["Tennis Club"]["participants"]) == (
+            initial_participants | {"workflow@mergington.edu"}
+        )
+
         # Unregister
-        response4 = client.post(
-            "/activities/Tennis%20Club/unregister?email=workflow@mergington.edu"
+        response4 = await async_client.post(
+            _PATHS["Tennis Club"] + "/unregister?email=workflow@mergington.edu"
         )
         assert response4.status_code == 200
-        
+
         # Verify unregister
-        response5 = client.get("/activities")
-        assert len(response5.json()["Tennis Club"]["participants"]) == initial_tennis_count
+        response5 = await async_client.get("/activities")
+        assert set(response5.json()["Tennis Club"]["participants"]) == initial_participants